@@ -3,9 +3,6 @@
 #
 """ Helpers for creating construct-related emitters. """
 
-import unittest
-import construct
-
 
 class ConstructEmitter:
     """ Class that creates a simple emitter based on a construct struct.
@@ -74,22 +71,6 @@ class ConstructEmitter:
             raise AttributeError(f"descriptor emitter has no property {name}")
 
 
-class ConstructEmitterTest(unittest.TestCase):
-
-    def test_simple_emitter(self):
-
-        test_struct = construct.Struct(
-            "a" / construct.Int8ul,
-            "b" / construct.Int8ul
-        )
-
-        emitter   = ConstructEmitter(test_struct)
-        emitter.a = 0xab
-        emitter.b = 0xcd
-
-        self.assertEqual(emitter.emit(), b"\xab\xcd")
-
-
 def emitter_for_format(construct_format):
     """ Creates a factory method for the relevant construct format. """
 
@@ -97,7 +78,3 @@ def emitter_for_format(construct_format):
         return ConstructEmitter(construct_format)
 
     return _factory
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -3,7 +3,6 @@
 #
 """ Type elements for defining USB descriptors. """
 
-import unittest
 import construct
 
 class DescriptorFormat(construct.Struct):
@@ -3,13 +3,10 @@
 #
 """ Structures describing Communications Device Class descriptors. """
 
-import unittest
 from enum import IntEnum
 
 import construct
-from   construct  import this, Default
 
-from .. import LanguageIDs
 from ..descriptor import \
     DescriptorField, DescriptorNumber, DescriptorFormat, \
     BCDFieldAdapter, DescriptorLength
@@ -11,14 +11,10 @@
     NOTE: This is not complete yet and will be extended as needed
 """
 
-from build.lib.usb_protocol.emitters import descriptor
-import unittest
 from enum import IntEnum
 
 import construct
-from   construct  import this, Default
 
-from .. import LanguageIDs
 from .standard import StandardDescriptorNumbers
 from ..descriptor import \
     DescriptorField, DescriptorNumber, DescriptorFormat, \